@@ -18,6 +18,7 @@ import os
 import os.path as op
 import re
 import shutil as sh
+import sys
 from pathlib import Path
 
 from scipy.io import loadmat, savemat
@@ -42,6 +43,38 @@ def _copytree(src, dst, **kwargs):
             raise
 
 
+def _copyfile_fast(src, dest):
+    """Copy a large binary file, using kernel-side copy where possible.
+
+    On Python >= 3.8, `shutil.copyfile` already uses zero-copy syscalls
+    such as `os.sendfile`. On Python 3.7 it falls back to a Python-level
+    read/write loop with a 16 kB buffer, which is slow for raw data files
+    that can reach several GB, so call `os.sendfile` directly there.
+    """
+    if sys.version_info >= (3, 8) or not hasattr(os, 'sendfile'):
+        sh.copyfile(src, dest)
+        return
+
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        try:
+            fsize = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < fsize:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset,
+                                   fsize - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # not all platforms/filesystems support sendfile between
+            # regular files; start over with a large buffer to at least
+            # amortize the syscall overhead
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            sh.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+
+
 def _get_brainvision_encoding(vhdr_file):
     """Get the encoding of .vhdr and .vmrk files.
 
@@ -320,7 +353,7 @@ def copyfile_brainvision(vhdr_src, vhdr_dest, anonymize=None, verbose=None):
     enc = _get_brainvision_encoding(vhdr_src)
 
     # Copy data .eeg ... no links to repair
-    sh.copyfile(eeg_file_path, fname_dest + '.eeg')
+    _copyfile_fast(eeg_file_path, fname_dest + '.eeg')
 
     # Write new header and marker files, fixing the file pointer links
     # For that, we need to replace an old "basename" with a new one
@@ -329,19 +362,21 @@ def copyfile_brainvision(vhdr_src, vhdr_dest, anonymize=None, verbose=None):
     assert basename_src + '.eeg' == op.split(eeg_file_path)[-1]
     assert basename_src + '.vmrk' == op.split(vmrk_file_path)[-1]
     __, basename_dest = op.split(fname_dest)
-    search_lines = ['DataFile=' + basename_src + '.eeg',
-                    'MarkerFile=' + basename_src + '.vmrk']
+    search_lines = {'DataFile=' + basename_src + '.eeg',
+                    'MarkerFile=' + basename_src + '.vmrk'}
 
+    # Stream line by line instead of reading the whole file into memory:
+    # marker files of long recordings can contain tens of thousands of lines
     with open(vhdr_src, 'r', encoding=enc) as fin:
         with open(vhdr_dest, 'w', encoding=enc) as fout:
-            for line in fin.readlines():
+            for line in fin:
                 if line.strip() in search_lines:
                     line = line.replace(basename_src, basename_dest)
                 fout.write(line)
 
     with open(vmrk_file_path, 'r', encoding=enc) as fin:
         with open(fname_dest + '.vmrk', 'w', encoding=enc) as fout:
-            for line in fin.readlines():
+            for line in fin:
                 if line.strip() in search_lines:
                     line = line.replace(basename_src, basename_dest)
                 fout.write(line)
@@ -8,7 +8,6 @@ import os
 import re
 from io import StringIO
 import shutil as sh
-from collections import OrderedDict
 from copy import deepcopy
 from os import path as op
 from pathlib import Path
@@ -26,7 +25,13 @@ from mne_bids.config import (
     ALLOWED_SPACES,
     reader, ENTITY_VALUE_TYPE)
 from mne_bids.utils import (_check_key_val, _check_empty_room_basename,
-                            param_regex, _ensure_tuple)
+                            param_regex, bad_chars_regex, _ensure_tuple)
+
+
+# Inverse of ALLOWED_PATH_ENTITIES_SHORT: map the long entity names used
+# by `BIDSPath` to the shorthand used in filenames, e.g. "subject" -> "sub"
+_long_to_short_entity = {
+    val: key for key, val in ALLOWED_PATH_ENTITIES_SHORT.items()}
 
 
 def _find_matched_empty_room(bids_path):
@@ -293,10 +298,10 @@ class BIDSPath(object):
                  task=None, acquisition=None, run=None, processing=None,
                  recording=None, space=None, split=None, root=None,
                  suffix=None, extension=None, datatype=None, check=True):
-        if all(ii is None for ii in [subject, session, task,
+        if all(ii is None for ii in (subject, session, task,
                                      acquisition, run, processing,
                                      recording, space, root, suffix,
-                                     extension]):
+                                     extension)):
             raise ValueError("At least one parameter must be given.")
 
         self.check = check
@@ -310,31 +315,26 @@ class BIDSPath(object):
     @property
     def entities(self):
         """Return dictionary of the BIDS entities."""
-        return OrderedDict([
-            ('subject', self.subject),
-            ('session', self.session),
-            ('task', self.task),
-            ('acquisition', self.acquisition),
-            ('run', self.run),
-            ('processing', self.processing),
-            ('space', self.space),
-            ('recording', self.recording),
-            ('split', self.split)
-        ])
+        return dict(
+            subject=self.subject,
+            session=self.session,
+            task=self.task,
+            acquisition=self.acquisition,
+            run=self.run,
+            processing=self.processing,
+            space=self.space,
+            recording=self.recording,
+            split=self.split,
+        )
 
     @property
     def basename(self):
         """Path basename."""
-        basename = []
-        for key, val in self.entities.items():
-            if val is not None and key != 'datatype':
-                # convert certain keys to shorthand
-                long_to_short_entity = {
-                    val: key for key, val
-                    in ALLOWED_PATH_ENTITIES_SHORT.items()
-                }
-                key = long_to_short_entity[key]
-                basename.append(f'{key}-{val}')
+        # build all entity key-value segments in a single pass, converting
+        # the keys to their filename shorthand
+        basename = [f'{_long_to_short_entity[key]}-{val}'
+                    for key, val in self.entities.items()
+                    if val is not None]
 
         if self.suffix is not None:
             if self.extension is not None:
@@ -342,8 +342,7 @@ class BIDSPath(object):
             else:
                 basename.append(self.suffix)
 
-        basename = '_'.join(basename)
-        return basename
+        return '_'.join(basename)
 
     @property
     def directory(self):
@@ -363,15 +362,15 @@ class BIDSPath(object):
         """
         # Create the data path based on the available entities:
         # root, subject, session, and datatype
-        data_path = '' if self.root is None else self.root
+        parts = []
         if self.subject is not None:
-            data_path = op.join(data_path, f'sub-{self.subject}')
+            parts.append(f'sub-{self.subject}')
         if self.session is not None:
-            data_path = op.join(data_path, f'ses-{self.session}')
+            parts.append(f'ses-{self.session}')
         # datatype will allow 'meg', 'eeg', 'ieeg', 'anat'
         if self.datatype is not None:
-            data_path = op.join(data_path, self.datatype)
-        return Path(data_path)
+            parts.append(self.datatype)
+        return Path('' if self.root is None else self.root, *parts)
 
     @property
     def subject(self) -> Optional[str]:
@@ -713,19 +712,22 @@ class BIDSPath(object):
             if not extension.startswith('.'):
                 kwargs['extension'] = f'.{extension}'
 
-        # error check entities
+        # check if there are any characters not allowed: scan all values at
+        # once and only fall back to the per-entity check (for a precise
+        # error message) if an offending character was found
+        # (suffix may skip the check if check=False, to allow things like
+        # "dataset_description.json")
+        to_check = [
+            (key, val) for key, val in kwargs.items()
+            if val is not None and key != 'root' and
+            not (key == 'suffix' and not self.check)]
+        if to_check and bad_chars_regex.search(
+                '\x00'.join(val for _, val in to_check)):
+            for key, val in to_check:
+                _check_key_val(key, val)
+
         old_kwargs = dict()
         for key, val in kwargs.items():
-
-            # check if there are any characters not allowed
-            if val is not None and key != 'root':
-                if key == 'suffix' and not self.check:
-                    # suffix may skip a check if check=False to allow
-                    # things like "dataset_description.json"
-                    pass
-                else:
-                    _check_key_val(key, val)
-
             # set entity value, ensuring `root` is a Path
             if val is not None and key == 'root':
                 val = Path(val).expanduser()
@@ -1154,6 +1156,56 @@ def _check_max_depth(max_depth):
     return max_depth
 
 
+def _iter_dir_tree(path, branchlen, max_depth,
+                   _scandir=os.scandir, _join=op.join,
+                   _basename=op.basename, _sep=os.sep):
+    """Recursively yield the ``print_dir_tree`` lines for one directory.
+
+    Being a generator, this allows consumers to stream the tree (e.g., into
+    a logger or over a network) without buffering it whole.
+
+    The trailing default arguments bind the ``os`` helpers as locals once at
+    definition time, saving the module attribute lookups in each call of this
+    recursion (one call per directory in the tree).
+    """
+    try:
+        it = _scandir(path)
+    except OSError:
+        # Mirror os.walk(onerror=None) and silently skip unreadable dirs
+        return
+
+    # Partition into subdirectories and files, using the stat information
+    # cached on the DirEntry objects. Symlinks pointing to directories are
+    # neither descended into nor listed as files, as with os.walk.
+    subdirs = []
+    files = []
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            elif not entry.is_dir():
+                files.append(entry.name)
+    subdirs.sort()
+    files.sort()
+
+    if branchlen <= 1:
+        yield '|{}'.format(_basename(path) + _sep)
+    else:
+        yield '|{} {}'.format((branchlen - 1) * '---',
+                              _basename(path) + _sep)
+
+    # Only yield files and descend further if we are NOT yet up to
+    # max_depth or beyond
+    if branchlen < max_depth:
+        prefix = '|{} '.format(branchlen * '---')
+        for file in files:
+            yield prefix + file
+
+        for subdir in subdirs:
+            yield from _iter_dir_tree(_join(path, subdir), branchlen + 1,
+                                      max_depth)
+
+
 def print_dir_tree(folder, max_depth=None, return_str=False):
     """Recursively print a directory tree.
 
@@ -1180,41 +1232,19 @@ def print_dir_tree(folder, max_depth=None, return_str=False):
     max_depth = _check_max_depth(max_depth)
 
     _validate_type(return_str, bool, 'return_str')
-    outfile = StringIO() if return_str else None
 
-    # Base length of a tree branch, to normalize each tree's start to 0
-    baselen = len(str(folder).split(os.sep)) - 1
-
-    # Recursively walk through all directories
-    for root, dirs, files in os.walk(folder, topdown=True):
-        # Since we're using `topdown=True`, sorting `dirs` ensures that
-        # `os.walk` will continue walking through directories in alphabetical
-        # order. So although we're not actually using `dirs` anywhere below,
-        # sorting it here is imperative to ensure the correct (alphabetical)
-        # directory sort order in the output.
-        dirs.sort()
-        files.sort()
-
-        # Check how far we have walked
-        branchlen = len(root.split(os.sep)) - baselen
-
-        # Only print if this is up to the depth we asked
-        if branchlen <= max_depth:
-            if branchlen <= 1:
-                print('|{}'.format(op.basename(root) + os.sep), file=outfile)
-            else:
-                print('|{} {}'.format((branchlen - 1) * '---',
-                                      op.basename(root) + os.sep),
-                      file=outfile)
+    # Collect all lines and emit them in one go at the end, rather than
+    # issuing one print call per line (large BIDS trees have many thousands
+    # of files)
+    if op.isdir(folder):
+        lines = list(_iter_dir_tree(str(folder), 1, max_depth))
+    else:
+        lines = []
 
-            # Only print files if we are NOT yet up to max_depth or beyond
-            if branchlen < max_depth:
-                for file in files:
-                    print('|{} {}'.format(branchlen * '---', file),
-                          file=outfile)
-
-    if outfile is not None:
-        return outfile.getvalue()
+    out = '\n'.join(lines) + '\n' if lines else ''
+    if return_str:
+        return out
+    print(out, end='')
 
 
 def _parse_ext(raw_fname):
@@ -1522,9 +1552,9 @@ def get_datatypes(root, verbose=None):
                      'meg', 'eeg', 'ieeg', 'nirs')
     datatypes = list()
     for root, dirs, files in os.walk(root):
-        for dir in dirs:
-            if dir in datatype_list and dir not in datatypes:
-                datatypes.append(dir)
+        for dir_name in dirs:
+            if dir_name in datatype_list and dir_name not in datatypes:
+                datatypes.append(dir_name)
 
     return datatypes
 
@@ -1672,35 +1702,39 @@ def get_entity_vals(root, entity_key, *, ignore_subjects='emptyroom',
 
         if ignore_datatypes and filename.parent.name in ignore_datatypes:
             continue
-        if ignore_subjects and any([filename.stem.startswith(f'sub-{s}_')
+
+        # `Path.stem` is recomputed on each access, so look it up only once
+        # per file
+        stem = filename.stem
+        if ignore_subjects and any([stem.startswith(f'sub-{s}_')
                                     for s in ignore_subjects]):
             continue
-        if ignore_sessions and any([f'_ses-{s}_' in filename.stem
+        if ignore_sessions and any([f'_ses-{s}_' in stem
                                     for s in ignore_sessions]):
             continue
-        if ignore_tasks and any([f'_task-{t}_' in filename.stem
+        if ignore_tasks and any([f'_task-{t}_' in stem
                                  for t in ignore_tasks]):
             continue
-        if ignore_runs and any([f'_run-{r}_' in filename.stem
+        if ignore_runs and any([f'_run-{r}_' in stem
                                 for r in ignore_runs]):
             continue
-        if ignore_processings and any([f'_proc-{p}_' in filename.stem
+        if ignore_processings and any([f'_proc-{p}_' in stem
                                        for p in ignore_processings]):
             continue
-        if ignore_spaces and any([f'_space-{s}_' in filename.stem
+        if ignore_spaces and any([f'_space-{s}_' in stem
                                   for s in ignore_spaces]):
             continue
-        if ignore_acquisitions and any([f'_acq-{a}_' in filename.stem
+        if ignore_acquisitions and any([f'_acq-{a}_' in stem
                                         for a in ignore_acquisitions]):
             continue
-        if ignore_splits and any([f'_split-{s}_' in filename.stem
+        if ignore_splits and any([f'_split-{s}_' in stem
                                   for s in ignore_splits]):
             continue
-        if ignore_modalities and any([f'_{k}' in filename.stem
+        if ignore_modalities and any([f'_{k}' in stem
                                       for k in ignore_modalities]):
             continue
 
-        match = p.search(filename.stem)
+        match = p.search(stem)
         value = match.group(1)
         if with_key:
             value = f'{entity_long_abbr_map[entity_key]}-{value}'
@@ -1721,9 +1755,9 @@ def _mkdir_p(path, overwrite=False):
         sh.rmtree(path)
         logger.info(f'Clearing path: {path}')
 
+    # `exist_ok=True` makes this a no-op if the directory is already there,
+    # without the cost of an extra stat or a Python-level exception
     os.makedirs(path, exist_ok=True)
-    if not op.isdir(path):
-        logger.info(f'Creating folder: {path}')
 
 
 def _find_best_candidates(params, candidate_list):
@@ -116,18 +116,20 @@ def _read_events(events_data, event_id, raw, bids_path=None):
 
     """
     # get events from events_data
-    if isinstance(events_data, np.ndarray):
+    if events_data is None:
+        events = np.empty(shape=(0, 3), dtype=int)
+    elif isinstance(events_data, np.ndarray):
         if events_data.ndim != 2:
             raise ValueError('Events must have two dimensions, '
                              f'found {events_data.ndim}')
         if events_data.shape[1] != 3:
             raise ValueError('Events must have second dimension of length 3, '
                              f'found {events_data.shape[1]}')
-        events = events_data
-    elif events_data is None:
-        events = np.empty(shape=(0, 3), dtype=int)
+        # hand downstream consumers a canonical (contiguous, int) layout,
+        # copying only if necessary
+        events = np.ascontiguousarray(events_data, dtype=int)
     else:
-        events = read_events(events_data).astype(int)
+        events = read_events(events_data).astype(int, copy=False)
 
     if events.size > 0:
         # Only keep events for which we have an ID <> description mapping.
@@ -26,6 +26,10 @@ from mne_bids.tsv_handler import _to_tsv
 # the value, except these special symbols: - _ . \ /
 param_regex = re.compile(r'([^-_\.\\\/]+)-([^-_\.\\\/]+)')
 
+# This regex matches any of the characters that entity keys and values may
+# not contain, according to the BIDS specification
+bad_chars_regex = re.compile(r'[-_/]')
+
 
 def _ensure_tuple(x):
     """Return a tuple."""
@@ -179,7 +183,7 @@ def _age_on_date(bday, exp_date):
 def _check_types(variables):
     """Make sure all vars are str or None."""
     for var in variables:
-        if not isinstance(var, (str, type(None))):
+        if var is not None and not isinstance(var, str):
             raise ValueError(f"You supplied a value ({var}) of type "
                              f"{type(var)}, where a string or None was "
                              f"expected.")
@@ -191,9 +195,11 @@ def _write_json(fname, dictionary, overwrite=False):
         raise FileExistsError(f'"{fname}" already exists. '
                               'Please set overwrite to True.')
 
-    json_output = json.dumps(dictionary, indent=4)
     with open(fname, 'w', encoding='utf-8') as fid:
-        fid.write(json_output)
+        # stream directly into the file instead of building the complete
+        # serialized string in memory first; write non-ASCII characters
+        # (e.g., author names) as UTF-8 instead of escape sequences
+        json.dump(dictionary, fid, indent=4, ensure_ascii=False)
         fid.write('\n')
 
     logger.info(f"Writing '{fname}'...")
@@ -224,7 +230,7 @@ def _write_text(fname, text, overwrite=False):
 
 def _check_key_val(key, val):
     """Perform checks on a value to make sure it adheres to the spec."""
-    if any(ii in val for ii in ['-', '_', '/']):
+    if bad_chars_regex.search(val):
         raise ValueError("Unallowed `-`, `_`, or `/` found in key/value pair"
                          f" {key}: {val}")
     return key, val
@@ -1041,6 +1041,11 @@ def _write_raw_edf(raw, bids_fname, overwrite):
     raw.export(bids_fname, overwrite=overwrite)
 
 
+# Matches a comma plus any surrounding whitespace, so that "a,b" and "a , b"
+# are split the same way as the documented "a, b" form
+_comma_sep_regex = re.compile(r'\s*,\s*')
+
+
 @verbose
 def make_dataset_description(path, name, data_license=None,
                              authors=None, acknowledgements=None,
@@ -1099,27 +1104,27 @@ def make_dataset_description(path, name, data_license=None,
     """
     # Put potential string input into list of strings
     if isinstance(authors, str):
-        authors = authors.split(', ')
+        authors = _comma_sep_regex.split(authors)
     if isinstance(funding, str):
-        funding = funding.split(', ')
+        funding = _comma_sep_regex.split(funding)
     if isinstance(references_and_links, str):
-        references_and_links = references_and_links.split(', ')
+        references_and_links = _comma_sep_regex.split(references_and_links)
     if dataset_type not in ['raw', 'derivative']:
         raise ValueError('`dataset_type` must be either "raw" or '
                          '"derivative."')
 
     fname = op.join(path, 'dataset_description.json')
-    description = OrderedDict([
-        ('Name', name),
-        ('BIDSVersion', BIDS_VERSION),
-        ('DatasetType', dataset_type),
-        ('License', data_license),
-        ('Authors', authors),
-        ('Acknowledgements', acknowledgements),
-        ('HowToAcknowledge', how_to_acknowledge),
-        ('Funding', funding),
-        ('ReferencesAndLinks', references_and_links),
-        ('DatasetDOI', doi)])
+    description = dict(
+        Name=name,
+        BIDSVersion=BIDS_VERSION,
+        DatasetType=dataset_type,
+        License=data_license,
+        Authors=authors,
+        Acknowledgements=acknowledgements,
+        HowToAcknowledge=how_to_acknowledge,
+        Funding=funding,
+        ReferencesAndLinks=references_and_links,
+        DatasetDOI=doi)
     if op.isfile(fname):
         with open(fname, 'r', encoding='utf-8-sig') as fin:
             orig_cols = json.load(fin)
@@ -1137,9 +1142,9 @@ def make_dataset_description(path, name, data_license=None,
     if authors is None and (description['Authors'] is None or overwrite):
         description['Authors'] = ["[Unspecified]"]
 
-    pop_keys = [key for key, val in description.items() if val is None]
-    for key in pop_keys:
-        description.pop(key)
+    # Only write out the fields that were actually set
+    description = {key: val for key, val in description.items()
+                   if val is not None}
     _write_json(fname, description, overwrite=True)
 
 